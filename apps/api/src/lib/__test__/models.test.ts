@@ -166,9 +166,21 @@ describe("Models", () => {
 			expect(mockCache.get).toHaveBeenCalledWith("model-config:test-model");
 		});
 
-		it("should cache result when cache is available", async () => {
-			await getModelConfig("gpt-4o", mockEnv);
+		it("should serve direct catalog hits without touching the cache", async () => {
+			const result = await getModelConfig("gpt-4o", mockEnv);
 
+			expect(result?.provider).toBe("openai");
+			expect(mockCache.get).not.toHaveBeenCalled();
+			expect(mockCache.set).not.toHaveBeenCalled();
+		});
+
+		it("should cache results that resolve through the matching-model scan", async () => {
+			const result = await getModelConfig("ai21-labs/ai21-jamba-1.5-mini", mockEnv, "github-models");
+
+			expect(result?.provider).toBe("github-models");
+			expect(mockCache.get).toHaveBeenCalledWith(
+				"model-config:ai21-labs/ai21-jamba-1.5-mini:github-models",
+			);
 			expect(mockCache.set).toHaveBeenCalled();
 		});
 
@@ -205,7 +205,16 @@ export function pruneMessagesToFitContext(
 	return pruned;
 }
 
+// Every rewrite in sanitiseInput keys off one of these characters (or a
+// space/tab run); input without any of them comes back unchanged bar the
+// trim, so it can skip the whole pipeline of regex passes.
+const SANITISE_TRIGGER = /[<`{}[\t]| {2}/;
+
 export function sanitiseInput(input: string): string {
+	if (!SANITISE_TRIGGER.test(input)) {
+		return input.trim();
+	}
+
 	const codeBlocks: string[] = [];
 	let codeBlockCount = 0;
 
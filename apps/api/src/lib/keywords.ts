@@ -248,6 +248,9 @@ export class KeywordFilter {
 
 	private hasPartialMatch(word: string): boolean {
 		for (const keyword of this.filter) {
+			if (!this.couldMeetThreshold(word, keyword)) {
+				continue;
+			}
 			if (this.calculateSimilarity(word, keyword) >= this.partialMatchThreshold) {
 				return true;
 			}
@@ -255,6 +258,21 @@ export class KeywordFilter {
 		return false;
 	}
 
+	/**
+	 * Edit distance is at least the length difference, so similarity is capped
+	 * at (longer - difference) / longer. Checking that cap first skips the
+	 * quadratic Levenshtein computation for most keyword pairs.
+	 */
+	private couldMeetThreshold(str1: string, str2: string): boolean {
+		const longer = Math.max(str1.length, str2.length);
+		if (longer === 0) {
+			return true;
+		}
+
+		const lengthDifference = Math.abs(str1.length - str2.length);
+		return (longer - lengthDifference) / longer >= this.partialMatchThreshold;
+	}
+
 	private calculateSimilarity(str1: string, str2: string): number {
 		const longer = str1.length > str2.length ? str1 : str2;
 		const shorter = str1.length > str2.length ? str2 : str1;
@@ -266,52 +284,67 @@ export class KeywordFilter {
 		return (longer.length - this.levenshteinDistance(longer, shorter)) / longer.length;
 	}
 
+	private static readonly MAX_CACHED_DISTANCES = 5000;
+	private readonly distanceCache = new Map<string, number>();
+
 	private levenshteinDistance(str1: string, str2: string): number {
-		const memo: Record<string, number> = {};
 		const key = `${str1}-${str2}`;
 
-		if (memo[key] !== undefined) {
-			return memo[key];
-		}
-
-		const matrix: number[][] = [];
-
-		for (let i = 0; i <= str1.length; i++) {
-			matrix[i] = [i];
+		const cached = this.distanceCache.get(key);
+		if (cached !== undefined) {
+			return cached;
 		}
 
+		// Each row only depends on the previous one, so two rows are enough;
+		// no need to materialise the full matrix.
+		let previousRow: number[] = [];
 		for (let j = 0; j <= str2.length; j++) {
-			matrix[0][j] = j;
+			previousRow[j] = j;
 		}
 
 		for (let i = 1; i <= str1.length; i++) {
+			const currentRow: number[] = [i];
 			for (let j = 1; j <= str2.length; j++) {
 				const cost = str1[i - 1] === str2[j - 1] ? 0 : 1;
-				matrix[i][j] = Math.min(
-					matrix[i - 1][j] + 1,
-					matrix[i][j - 1] + 1,
-					matrix[i - 1][j - 1] + cost,
+				currentRow[j] = Math.min(
+					previousRow[j] + 1,
+					currentRow[j - 1] + 1,
+					previousRow[j - 1] + cost,
 				);
 			}
+			previousRow = currentRow;
 		}
 
-		memo[key] = matrix[str1.length][str2.length];
-		return memo[key];
+		const distance = previousRow[str2.length];
+
+		if (this.distanceCache.size >= KeywordFilter.MAX_CACHED_DISTANCES) {
+			this.distanceCache.clear();
+		}
+		this.distanceCache.set(key, distance);
+
+		return distance;
 	}
 
 	private findKeywordCategory(word: string): string | null {
 		for (const [category, keywords] of Object.entries(KeywordFilter.CODING_KEYWORDS)) {
-			if (keywords.some((k) => this.calculateSimilarity(word, k) >= this.partialMatchThreshold)) {
+			if (keywords.some((k) => this.isSimilarEnough(word, k))) {
 				return `coding_${category}`;
 			}
 		}
 
 		for (const [category, keywords] of Object.entries(KeywordFilter.MATH_KEYWORDS)) {
-			if (keywords.some((k) => this.calculateSimilarity(word, k) >= this.partialMatchThreshold)) {
+			if (keywords.some((k) => this.isSimilarEnough(word, k))) {
 				return `math_${category}`;
 			}
 		}
 
 		return null;
 	}
+
+	private isSimilarEnough(word: string, keyword: string): boolean {
+		return (
+			this.couldMeetThreshold(word, keyword) &&
+			this.calculateSimilarity(word, keyword) >= this.partialMatchThreshold
+		);
+	}
 }
@@ -104,7 +104,15 @@ export class PromptAnalyzer {
 		return `${normalisedDescription.slice(0, FUNCTION_DESCRIPTION_MAX_CHARS - 3)}...`;
 	}
 
+	// The tool registry is populated once at module load, so the summary is
+	// computed once per isolate instead of on every analysis.
+	private static functionSummaryCache: string | null = null;
+
 	private static summarizeAvailableFunctions(): string {
+		if (PromptAnalyzer.functionSummaryCache !== null) {
+			return PromptAnalyzer.functionSummaryCache;
+		}
+
 		const tools = listFunctionTools();
 		const summaries: string[] = [];
 		let usedCharacters = 0;
@@ -123,7 +131,8 @@ export class PromptAnalyzer {
 			usedCharacters += separatorLength + summary.length;
 		}
 
-		return summaries.join("; ");
+		PromptAnalyzer.functionSummaryCache = summaries.join("; ");
+		return PromptAnalyzer.functionSummaryCache;
 	}
 
 	private static constructsystem_prompt(keywords: string[]): string {
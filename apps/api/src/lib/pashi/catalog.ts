@@ -1,3 +1,4 @@
+import { selectTopK } from "~/utils/arrays";
 import type { PashiField, PashiTool, PashiToolType } from "./contracts";
 
 export interface PashiToolSummary {
@@ -137,15 +138,18 @@ export function searchPashiTools(params: {
 	const queryTerms = (params.query ?? "").trim().toLowerCase().split(/\s+/).filter(Boolean);
 	const toolTypes = new Set(params.toolTypes);
 
-	return params.tools
+	const candidates = params.tools
 		.filter((tool) => toolTypes.has(tool.toolType))
 		.map((tool, index) => ({
 			index,
 			score: scorePashiTool(tool, queryTerms),
 			tool,
 		}))
-		.filter(({ score }) => score > 0)
-		.sort((left, right) => right.score - left.score || left.index - right.index)
-		.slice(0, params.limit)
-		.map(({ tool }) => toPashiToolSummary(tool));
+		.filter(({ score }) => score > 0);
+
+	return selectTopK(
+		candidates,
+		params.limit,
+		(left, right) => right.score - left.score || left.index - right.index,
+	).map(({ tool }) => toPashiToolSummary(tool));
 }
@@ -230,6 +230,13 @@ export async function getModelConfig(
 	const resolvedProvider = provider ?? (key === defaultModel ? defaultProvider : undefined);
 	const cacheParts = resolvedProvider ? [key, resolvedProvider] : [key];
 
+	// The static catalog is already resident in memory; a direct hit needs no
+	// KV round trip, which otherwise adds a cold read per isolate per model.
+	const directConfig = modelConfig[key];
+	if (directConfig && (!resolvedProvider || directConfig.provider === resolvedProvider)) {
+		return directConfig;
+	}
+
 	const staticConfig = await withCache(env, "model-config", cacheParts, () => {
 		const config = modelConfig[key];
 		if (config && (!resolvedProvider || config.provider === resolvedProvider)) {
@@ -578,7 +585,7 @@ export async function filterModelsForUserAccess(
 export async function getAuxiliaryModel(
 	env: IEnv,
 	user?: IUser,
-): Promise<{ model: string; provider: string }> {
+): Promise<{ model: string; provider: string; config?: ModelConfigItem }> {
 	let modelToUse = "@cf/zai-org/glm-4.7-flash";
 
 	const availableModels = await getIncludedInRouterModelsForUser(env, user?.id);
@@ -593,7 +600,11 @@ export async function getAuxiliaryModel(
 
 	const modelConfig = await getModelConfig(modelToUse, env);
 
-	return { model: modelConfig.matchingModel, provider: modelConfig.provider };
+	return {
+		model: modelConfig.matchingModel,
+		provider: modelConfig.provider,
+		config: modelConfig,
+	};
 }
 
 export const getAuxiliaryModelForRetrieval = async (env: IEnv, user?: IUser) => {
@@ -611,7 +622,11 @@ export const getAuxiliaryModelForRetrieval = async (env: IEnv, user?: IUser) =>
 
 	const modelConfig = await getModelConfig(modelToUse, env);
 
-	return { model: modelConfig.matchingModel, provider: modelConfig.provider };
+	return {
+		model: modelConfig.matchingModel,
+		provider: modelConfig.provider,
+		config: modelConfig,
+	};
 };
 
 export const getAuxiliaryGuardrailsModel = async (env: IEnv, user?: IUser) => {
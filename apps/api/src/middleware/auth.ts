@@ -7,6 +7,7 @@ import { getUserByJwtToken } from "~/services/auth/jwt";
 import { getUserBySessionId } from "~/services/auth/user";
 import type { AnonymousUser, User } from "~/types";
 import { AssistantError, ErrorType } from "~/utils/errors";
+import { fastHash } from "~/utils/hash";
 import { getLogger } from "~/utils/logger";
 
 const logger = getLogger({ prefix: "middleware/auth" });
@@ -27,6 +28,8 @@ function getBotCache(kv: any): KVCache | null {
 	return botCache;
 }
 
+const inFlightBotChecks = new Map<string, Promise<boolean>>();
+
 async function isBotCached(userAgent: string, kv: any): Promise<boolean> {
 	const cache = getBotCache(kv);
 	if (!cache) {
@@ -38,26 +41,45 @@ async function isBotCached(userAgent: string, kv: any): Promise<boolean> {
 		}
 	}
 
-	const cacheKey = KVCache.createKey("bot", userAgent);
-
-	const cached = await cache.get<boolean>(cacheKey);
-	if (cached !== null) {
-		return cached;
+	// Coalesce concurrent checks for the same user agent into one lookup so a
+	// burst of requests triggers a single KV read/write instead of one each.
+	const inFlight = inFlightBotChecks.get(userAgent);
+	if (inFlight) {
+		return inFlight;
 	}
 
-	let isBotUser: boolean;
-	try {
-		isBotUser = isbot(userAgent);
-	} catch (error) {
-		logger.error("Failed to check if user is a bot:", { error });
-		isBotUser = true;
-	}
+	const pending = (async () => {
+		// Hash the user agent rather than embedding it raw: UA strings can
+		// exceed the KV key-length limit and a short fixed key is cheaper to
+		// look up. A collision only shares a cached bot verdict, so the fast
+		// non-cryptographic hash is fine here.
+		const cacheKey = KVCache.createKey("bot", fastHash(userAgent));
+
+		const cached = await cache.get<boolean>(cacheKey);
+		if (cached !== null) {
+			return cached;
+		}
+
+		let isBotUser: boolean;
+		try {
+			isBotUser = isbot(userAgent);
+		} catch (error) {
+			logger.error("Failed to check if user is a bot:", { error });
+			isBotUser = true;
+		}
+
+		cache.set(cacheKey, isBotUser).catch((error) => {
+			logger.error("Failed to cache bot detection result", { error, userAgent });
+		});
 
-	cache.set(cacheKey, isBotUser).catch((error) => {
-		logger.error("Failed to cache bot detection result", { error, userAgent });
+		return isBotUser;
+	})().finally(() => {
+		inFlightBotChecks.delete(userAgent);
 	});
 
-	return isBotUser;
+	inFlightBotChecks.set(userAgent, pending);
+
+	return pending;
 }
 
 function parseCookies(cookieHeader: string): Record<string, string> {
@@ -1,4 +1,5 @@
 import type { Agent, AgentInstall, AgentRating, SharedAgent } from "~/lib/database/schema";
+import { selectTopK } from "~/utils/arrays";
 import { generateId } from "~/utils/id";
 import { getLogger } from "~/utils/logger";
 import { AssistantError, ErrorType } from "~/utils/errors";
@@ -581,10 +582,9 @@ export class SharedAgentRepository extends BaseRepository {
 			}
 		}
 
-		return Object.entries(tagCounts)
-			.sort(([, a], [, b]) => b - a)
-			.slice(0, limit)
-			.map(([tag]) => tag);
+		return selectTopK(Object.entries(tagCounts), limit, ([, a], [, b]) => b - a).map(
+			([tag]) => tag,
+		);
 	}
 }
 
@@ -137,8 +137,23 @@ async function setupMCPFunctions(agent: CompletionAgent, env: IEnv) {
 		});
 		registerMCPClient(agent.id, mcp);
 
-		for (const cfg of serverConfigs) {
-			await collectServerTools(agent, mcp, cfg, mcpFunctions);
+		// Server connections are independent and network-bound, so establish
+		// them in parallel, then read the aggregated tool list once instead of
+		// once per server.
+		const mcpManager = mcp;
+		const connections = await Promise.all(
+			serverConfigs.map((cfg) => connectServer(mcpManager, cfg)),
+		);
+
+		if (connections.some(Boolean)) {
+			const rawTools = await mcp.getAITools();
+
+			for (const [name, def] of Object.entries(rawTools)) {
+				const toolDefinition = resolveMCPAIToolDefinition(agent.id, name, def);
+				if (toolDefinition) {
+					mcpFunctions.push(toolDefinition);
+				}
+			}
 		}
 	} catch (error) {
 		logger.error("Error setting up MCP functions", {
@@ -149,12 +164,7 @@ async function setupMCPFunctions(agent: CompletionAgent, env: IEnv) {
 	return mcpFunctions;
 }
 
-async function collectServerTools(
-	agent: CompletionAgent,
-	mcp: MCPClientManager,
-	cfg: MCPServerConfig,
-	mcpFunctions: AgentMCPToolDefinition[],
-) {
+async function connectServer(mcp: MCPClientManager, cfg: MCPServerConfig): Promise<boolean> {
 	try {
 		const readyConnection = await connectMCPServerReady(mcp, cfg);
 		if ("error" in readyConnection) {
@@ -162,23 +172,16 @@ async function collectServerTools(
 				server_url: cfg.url,
 				error_message: readyConnection.error,
 			});
-			return;
+			return false;
 		}
 
-		const rawTools = await mcp.getAITools();
-		const defs = Object.entries(rawTools);
-
-		for (const [name, def] of defs) {
-			const toolDefinition = resolveMCPAIToolDefinition(agent.id, name, def);
-			if (toolDefinition) {
-				mcpFunctions.push(toolDefinition);
-			}
-		}
+		return true;
 	} catch (error) {
 		logger.error("Error connecting to MCP server", {
 			server_url: cfg.url,
 			error_message: error instanceof Error ? error.message : "Unknown error",
 		});
+		return false;
 	}
 }
 
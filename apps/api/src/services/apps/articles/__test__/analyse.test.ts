@@ -184,6 +184,35 @@ describe("analyseArticle", () => {
 		);
 	});
 
+	it("should serve a cached analysis without calling the provider", async () => {
+		const cachedAnalysis = {
+			content: "Cached analysis",
+			model: "test-model",
+			id: "cached-id",
+			citations: [],
+			log_id: "cached-log",
+			verifiedQuotes: { verified: ["quote1"], missing: ["quote2"] },
+		};
+		const envWithCache = {
+			DB: {},
+			CACHE: {
+				get: vi.fn().mockResolvedValue(JSON.stringify(cachedAnalysis)),
+				put: vi.fn().mockResolvedValue(undefined),
+			},
+		} as any;
+
+		mockAppDataRepo.createAppDataWithItem.mockResolvedValue({
+			id: "saved-data-id",
+		});
+
+		const result = await analyseArticle({ ...mockParams, env: envWithCache });
+
+		expect(mockProvider.getResponse).not.toHaveBeenCalled();
+		expect(result.analysis?.content).toBe("Cached analysis");
+		expect(result.analysis?.data).toEqual(cachedAnalysis);
+		expect(mockAppDataRepo.createAppDataWithItem).toHaveBeenCalled();
+	});
+
 	it("should handle analysis response with only response field", async () => {
 		const mockAnalysisResponse = {
 			response: "Analysis using response field",
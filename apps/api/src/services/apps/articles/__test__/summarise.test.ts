@@ -38,7 +38,7 @@ vi.mock("~/lib/chat/utils", () => ({
 }));
 
 vi.mock("~/lib/providers/models", () => ({
-	getAuxiliaryModelForRetrieval: vi.fn(),
+	getAuxiliaryModel: vi.fn(),
 	findModelConfig: vi.fn(),
 }));
 
@@ -84,9 +84,8 @@ describe("summariseArticle", () => {
 	beforeEach(async () => {
 		vi.clearAllMocks();
 		appDataRepoFactory = () => mockAppDataRepo;
-		const { getAuxiliaryModelForRetrieval, findModelConfig } =
-			await import("~/lib/providers/models");
-		vi.mocked(getAuxiliaryModelForRetrieval).mockResolvedValue({
+		const { getAuxiliaryModel, findModelConfig } = await import("~/lib/providers/models");
+		vi.mocked(getAuxiliaryModel).mockResolvedValue({
 			model: "test-model",
 			provider: "test-provider",
 		});
@@ -193,6 +192,34 @@ describe("summariseArticle", () => {
 		);
 	});
 
+	it("should serve a cached summary without calling the provider", async () => {
+		const cachedSummary = {
+			content: "Cached summary",
+			model: "test-model",
+			id: "cached-id",
+			citations: [],
+			log_id: "cached-log",
+			verifiedQuotes: { verified: true, missingQuotes: [] },
+		};
+		const envWithCache = {
+			DB: {},
+			CACHE: {
+				get: vi.fn().mockResolvedValue(JSON.stringify(cachedSummary)),
+				put: vi.fn().mockResolvedValue(undefined),
+			},
+		} as any;
+
+		mockAppDataRepo.createAppDataWithItem.mockResolvedValue({
+			id: "saved-summary-id",
+		});
+
+		const result = await summariseArticle({ ...mockParams, env: envWithCache });
+
+		expect(mockProvider.getResponse).not.toHaveBeenCalled();
+		expect(result.summary?.content).toBe("Cached summary");
+		expect(mockAppDataRepo.createAppDataWithItem).toHaveBeenCalled();
+	});
+
 	it("should handle summary response with only response field", async () => {
 		const mockSummaryResponse = {
 			response: "Summary using response field",
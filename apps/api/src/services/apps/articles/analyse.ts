@@ -1,9 +1,12 @@
+import { KVCache } from "~/lib/cache";
 import { sanitiseInput } from "~/lib/chat/utils";
-import { findModelConfig, getAuxiliaryModelForRetrieval } from "~/lib/providers/models";
+import { getAuxiliaryModelForRetrieval } from "~/lib/providers/models";
 import { analyseArticlePrompt } from "~/lib/prompts";
 import { getChatProvider } from "~/lib/providers/capabilities/chat";
 import { createServiceContext, type ServiceContext } from "~/lib/context/serviceContext";
 import type { IEnv, IUser } from "~/types";
+import { sha256Hex } from "~/utils/crypto";
+import { truncateAtWordBoundary } from "~/utils/strings";
 import { AssistantError, ErrorType } from "~/utils/errors";
 import { extractQuotes } from "~/utils/extract";
 import { getLogger } from "~/utils/logger";
@@ -16,6 +19,15 @@ export interface Params {
 	itemId: string;
 }
 
+interface AnalysisResult {
+	content: string;
+	model: string;
+	id?: string;
+	citations?: any;
+	log_id?: string;
+	verifiedQuotes?: any;
+}
+
 export interface AnalyseSuccessResponse {
 	status: "success";
 	message?: string;
@@ -65,56 +77,73 @@ export async function analyseArticle({
 
 		const sanitisedArticle = sanitiseInput(args.article);
 
-		const { model: modelToUse, provider: providerToUse } = await getAuxiliaryModelForRetrieval(
-			serviceContext.env,
-			user,
-		);
-		const modelConfig = await findModelConfig(modelToUse, serviceContext.env, providerToUse);
+		const {
+			model: modelToUse,
+			provider: providerToUse,
+			config: modelConfig,
+		} = await getAuxiliaryModelForRetrieval(serviceContext.env, user);
 		const provider = getChatProvider(providerToUse, {
 			env: serviceContext.env,
 			user,
 		});
-		const analysisData = await provider.getResponse({
-			completion_id,
-			app_url,
-			model: modelToUse,
-			messages: [
-				{
-					role: "user",
-					content: analyseArticlePrompt(sanitisedArticle, {
-						modelId: modelToUse,
-						modelConfig,
-					}),
-				},
-			],
-			env: serviceContext.env,
-			context: serviceContext,
-		});
+		// Analysis output depends only on the article content and model, so
+		// repeated requests for the same text can skip the provider call.
+		const cache = serviceContext.env.CACHE ? new KVCache(serviceContext.env.CACHE) : null;
+		const analysisCacheKey = cache
+			? KVCache.createKey("article-analysis", modelToUse, await sha256Hex(sanitisedArticle))
+			: null;
 
-		const analysisDataContent = analysisData.content || analysisData.response;
+		let analysisResult = analysisCacheKey
+			? await cache.get<AnalysisResult>(analysisCacheKey)
+			: null;
 
-		if (!analysisDataContent) {
-			throw new AssistantError("Analysis content was empty", ErrorType.PARAMS_ERROR);
-		}
+		if (!analysisResult) {
+			const analysisData = await provider.getResponse({
+				completion_id,
+				app_url,
+				model: modelToUse,
+				messages: [
+					{
+						role: "user",
+						content: analyseArticlePrompt(sanitisedArticle, {
+							modelId: modelToUse,
+							modelConfig,
+						}),
+					},
+				],
+				env: serviceContext.env,
+				context: serviceContext,
+			});
 
-		const quotes = extractQuotes(analysisDataContent);
-		const verifiedQuotes = verifyQuotes(sanitisedArticle, quotes);
+			const analysisDataContent = analysisData.content || analysisData.response;
 
-		const analysisResult = {
-			content: analysisDataContent,
-			model: modelToUse,
-			id: analysisData.id,
-			citations: analysisData.citations,
-			log_id: analysisData.log_id,
-			verifiedQuotes,
-		};
+			if (!analysisDataContent) {
+				throw new AssistantError("Analysis content was empty", ErrorType.PARAMS_ERROR);
+			}
+
+			const quotes = extractQuotes(analysisDataContent);
+			const verifiedQuotes = verifyQuotes(sanitisedArticle, quotes);
+
+			analysisResult = {
+				content: analysisDataContent,
+				model: modelToUse,
+				id: analysisData.id,
+				citations: analysisData.citations,
+				log_id: analysisData.log_id,
+				verifiedQuotes,
+			};
+
+			if (analysisCacheKey) {
+				cache.set(analysisCacheKey, analysisResult).catch(() => {});
+			}
+		}
 
 		serviceContext.ensureDatabase();
 		const appDataRepo = serviceContext.repositories.appData;
 		const appData = {
 			originalArticle: args.article,
 			analysis: analysisResult,
-			title: `Analysis: ${args.article.substring(0, 80)}...`,
+			title: `Analysis: ${truncateAtWordBoundary(args.article, 80)}...`,
 		};
 		const savedData = await appDataRepo.createAppDataWithItem(
 			user.id,
@@ -131,7 +160,7 @@ export async function analyseArticle({
 			itemId: args.itemId,
 			analysis: {
 				content: analysisResult.content,
-				data: { ...analysisResult, verifiedQuotes },
+				data: { ...analysisResult },
 			},
 		};
 	} catch (error) {
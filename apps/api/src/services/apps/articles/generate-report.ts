@@ -1,4 +1,4 @@
-import { findModelConfig, getAuxiliaryModelForRetrieval } from "~/lib/providers/models";
+import { getAuxiliaryModelForRetrieval } from "~/lib/providers/models";
 import { generateArticleReportPrompt } from "~/lib/prompts";
 import { getChatProvider } from "~/lib/providers/capabilities/chat";
 import { createServiceContext, type ServiceContext } from "~/lib/context/serviceContext";
@@ -93,11 +93,11 @@ export async function generateArticlesReport({
 			);
 		}
 
-		const { model: modelToUse, provider: providerToUse } = await getAuxiliaryModelForRetrieval(
-			serviceContext.env,
-			user,
-		);
-		const modelConfig = await findModelConfig(modelToUse, serviceContext.env, providerToUse);
+		const {
+			model: modelToUse,
+			provider: providerToUse,
+			config: modelConfig,
+		} = await getAuxiliaryModelForRetrieval(serviceContext.env, user);
 		const provider = getChatProvider(providerToUse, {
 			env: serviceContext.env,
 			user,
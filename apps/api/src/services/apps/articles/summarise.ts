@@ -1,9 +1,12 @@
+import { KVCache } from "~/lib/cache";
 import { sanitiseInput } from "~/lib/chat/utils";
-import { findModelConfig, getAuxiliaryModelForRetrieval } from "~/lib/providers/models";
+import { getAuxiliaryModel } from "~/lib/providers/models";
 import { summariseArticlePrompt } from "~/lib/prompts";
 import { getChatProvider } from "~/lib/providers/capabilities/chat";
 import { createServiceContext, type ServiceContext } from "~/lib/context/serviceContext";
 import type { IEnv, IUser } from "~/types";
+import { sha256Hex } from "~/utils/crypto";
+import { truncateAtWordBoundary } from "~/utils/strings";
 import { AssistantError, ErrorType } from "~/utils/errors";
 import { extractQuotes } from "~/utils/extract";
 import { getLogger } from "~/utils/logger";
@@ -16,6 +19,15 @@ export interface Params {
 	itemId: string;
 }
 
+interface SummaryResult {
+	content: string;
+	model: string;
+	id?: string;
+	citations?: any;
+	log_id?: string;
+	verifiedQuotes?: any;
+}
+
 export interface SummariseSuccessResponse {
 	status: "success";
 	message?: string;
@@ -65,57 +77,72 @@ export async function summariseArticle({
 			throw new AssistantError("Service context is required", ErrorType.CONFIGURATION_ERROR);
 		}
 
-		const { model: modelToUse, provider: providerToUse } = await getAuxiliaryModelForRetrieval(
-			serviceContext.env,
-			user,
-		);
-		const modelConfig = await findModelConfig(modelToUse, serviceContext.env, providerToUse);
+		const {
+			model: modelToUse,
+			provider: providerToUse,
+			config: modelConfig,
+		} = await getAuxiliaryModel(serviceContext.env, user);
 		const provider = getChatProvider(providerToUse, {
 			env: serviceContext.env,
 			user,
 		});
 
-		const summaryGenData = await provider.getResponse({
-			completion_id,
-			app_url,
-			model: modelToUse,
-			messages: [
-				{
-					role: "user",
-					content: summariseArticlePrompt(sanitisedArticle, {
-						modelId: modelToUse,
-						modelConfig,
-					}),
-				},
-			],
-			env: serviceContext.env,
-			context: serviceContext,
-		});
-
-		const summaryGenDataContent = summaryGenData.content || summaryGenData.response;
-
-		if (!summaryGenDataContent) {
-			throw new AssistantError("Summary content was empty", ErrorType.PARAMS_ERROR);
+		// Summaries are deterministic in article content and model, so repeated
+		// requests for the same text can skip the provider call entirely.
+		const cache = serviceContext.env.CACHE ? new KVCache(serviceContext.env.CACHE) : null;
+		const summaryCacheKey = cache
+			? KVCache.createKey("article-summary", modelToUse, await sha256Hex(sanitisedArticle))
+			: null;
+
+		let summaryResult = summaryCacheKey ? await cache.get<SummaryResult>(summaryCacheKey) : null;
+
+		if (!summaryResult) {
+			const summaryGenData = await provider.getResponse({
+				completion_id,
+				app_url,
+				model: modelToUse,
+				messages: [
+					{
+						role: "user",
+						content: summariseArticlePrompt(sanitisedArticle, {
+							modelId: modelToUse,
+							modelConfig,
+						}),
+					},
+				],
+				env: serviceContext.env,
+				context: serviceContext,
+			});
+
+			const summaryGenDataContent = summaryGenData.content || summaryGenData.response;
+
+			if (!summaryGenDataContent) {
+				throw new AssistantError("Summary content was empty", ErrorType.PARAMS_ERROR);
+			}
+
+			const quotes = extractQuotes(summaryGenDataContent);
+			const verifiedQuotes = verifyQuotes(args.article, quotes);
+
+			summaryResult = {
+				content: summaryGenDataContent,
+				model: modelToUse,
+				id: summaryGenData.id,
+				citations: summaryGenData.citations,
+				log_id: summaryGenData.log_id,
+				verifiedQuotes,
+			};
+
+			if (summaryCacheKey) {
+				cache.set(summaryCacheKey, summaryResult).catch(() => {});
+			}
 		}
 
-		const quotes = extractQuotes(summaryGenDataContent);
-		const verifiedQuotes = verifyQuotes(args.article, quotes);
-
-		const summaryResult = {
-			content: summaryGenDataContent,
-			model: modelToUse,
-			id: summaryGenData.id,
-			citations: summaryGenData.citations,
-			log_id: summaryGenData.log_id,
-			verifiedQuotes,
-		};
-
 		serviceContext.ensureDatabase();
 		const appDataRepo = serviceContext.repositories.appData;
 		const appData = {
 			originalArticle: args.article,
 			summary: summaryResult,
-			title: `Summary: ${args.article.substring(0, 80)}...`,
+			title: `Summary: ${truncateAtWordBoundary(args.article, 80)}...`,
 		};
 
 		const savedData = await appDataRepo.createAppDataWithItem(
@@ -133,7 +160,7 @@ export async function summariseArticle({
 			itemId: args.itemId,
 			summary: {
 				content: summaryResult.content,
-				data: { ...summaryResult, verifiedQuotes },
+				data: { ...summaryResult },
 			},
 		};
 	} catch (error) {
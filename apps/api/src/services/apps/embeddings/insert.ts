@@ -128,22 +128,25 @@ export const insertEmbedding = async (req: IInsertEmbeddingRequest): Promise<any
 		const chunks = chunkText(content, maxChars);
 		let allGenerated: EmbeddingVector[] = [];
 		if (chunks.length > 1) {
-			for (let i = 0; i < chunks.length; i++) {
-				const chunk = chunks[i];
-				const chunkId = `${id || uniqueId}-${i}`;
-				const chunkMeta = { ...scopedMetadata, chunkIndex: i.toString() };
-
-				pendingDbRecords.push({
-					id: chunkId,
-					metadata: chunkMeta,
-					title: `${title} (chunk ${i})`,
-					content: chunk,
-					type,
-				});
-
-				const vecs = await embedding.generate(type, chunk, chunkId, chunkMeta);
-				allGenerated.push(...vecs);
-			}
+			// Generate all chunk embeddings in one batch rather than one awaited
+			// round trip per chunk; Promise.all preserves chunk order.
+			const generated = await Promise.all(
+				chunks.map((chunk, i) => {
+					const chunkId = `${id || uniqueId}-${i}`;
+					const chunkMeta = { ...scopedMetadata, chunkIndex: i.toString() };
+
+					pendingDbRecords.push({
+						id: chunkId,
+						metadata: chunkMeta,
+						title: `${title} (chunk ${i})`,
+						content: chunk,
+						type,
+					});
+
+					return embedding.generate(type, chunk, chunkId, chunkMeta);
+				}),
+			);
+			allGenerated = generated.flat();
 		} else {
 			allGenerated = await embedding.generate(type, content, id || uniqueId, newMetadata);
 		}
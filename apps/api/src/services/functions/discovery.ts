@@ -46,42 +46,49 @@ export const search_functions: ApiToolDefinition = {
 
 		const isProUser = req.user?.plan_id === "pro";
 		const isSignedIn = Boolean(req.user?.id);
-		const searchTerms = query.toLowerCase().split(/\s+/);
+		const queryLower = query.toLowerCase();
+		const searchTerms = queryLower.split(/\s+/);
 		const availableFunctions = listFunctionTools();
 
-		const scoredFunctions = availableFunctions
-			.filter((fn) => {
-				if (!fn || !fn.name) {
-					return false;
+		// Score in a single pass: the chained filter/map/filter version built
+		// an intermediate array per stage and re-lowercased the name and
+		// description once per search term.
+		const candidates: Array<{ function: (typeof availableFunctions)[number]; score: number }> = [];
+		for (const fn of availableFunctions) {
+			if (!fn || !fn.name) {
+				continue;
+			}
+			if (fn.type === "premium" && !isProUser && !include_premium) {
+				continue;
+			}
+
+			const nameLower = fn.name.toLowerCase();
+			const descriptionLower = fn.description.toLowerCase();
+
+			let score = 0;
+			for (const term of searchTerms) {
+				if (nameLower.includes(term)) {
+					score += 10;
 				}
-				if (fn.type === "premium" && !isProUser && !include_premium) {
-					return false;
-				}
-				return true;
-			})
-			.map((fn) => {
-				let score = 0;
-
-				for (const term of searchTerms) {
-					if (fn.name.toLowerCase().includes(term)) {
-						score += 10;
-					}
-					if (fn.description.toLowerCase().includes(term)) {
-						score += 5;
-					}
+				if (descriptionLower.includes(term)) {
+					score += 5;
 				}
+			}
 
-				if (fn.name.toLowerCase() === query.toLowerCase()) {
-					score += 50;
-				}
+			if (nameLower === queryLower) {
+				score += 50;
+			}
 
-				if (fn.isDefault) {
-					score += 2;
-				}
+			if (fn.isDefault) {
+				score += 2;
+			}
+
+			if (score > 0) {
+				candidates.push({ function: fn, score });
+			}
+		}
 
-				return { function: fn, score };
-			})
-			.filter((item) => item.score > 0)
+		const scoredFunctions = candidates
 			.sort((a, b) => b.score - a.score)
 			.slice(0, Math.max(1, Math.min(limit, 50)));
 
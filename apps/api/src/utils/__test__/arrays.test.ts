@@ -0,0 +1,40 @@
+import { describe, expect, it } from "vitest";
+
+import { selectTopK } from "../arrays";
+
+const ascending = (a: number, b: number) => a - b;
+const descending = (a: number, b: number) => b - a;
+
+describe("arrays", () => {
+	describe("selectTopK", () => {
+		it("should match sort-then-slice for the k best items", () => {
+			const items = [5, 3, 8, 1, 9, 2, 7, 4, 6];
+
+			expect(selectTopK(items, 3, ascending)).toEqual([1, 2, 3]);
+			expect(selectTopK(items, 3, descending)).toEqual([9, 8, 7]);
+		});
+
+		it("should return all items sorted when k exceeds the input length", () => {
+			expect(selectTopK([3, 1, 2], 10, ascending)).toEqual([1, 2, 3]);
+		});
+
+		it("should return an empty array for k of zero", () => {
+			expect(selectTopK([3, 1, 2], 0, ascending)).toEqual([]);
+		});
+
+		it("should not mutate the input", () => {
+			const items = [5, 3, 8, 1];
+
+			selectTopK(items, 2, ascending);
+
+			expect(items).toEqual([5, 3, 8, 1]);
+		});
+
+		it("should agree with a full sort on larger input", () => {
+			const items = Array.from({ length: 500 }, (_, i) => (i * 7919) % 1000);
+			const expected = [...items].sort(ascending).slice(0, 25);
+
+			expect(selectTopK(items, 25, ascending)).toEqual(expected);
+		});
+	});
+});
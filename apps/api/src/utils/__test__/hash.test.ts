@@ -0,0 +1,29 @@
+import { describe, expect, it } from "vitest";
+
+import { fastHash } from "../hash";
+
+describe("hash", () => {
+	describe("fastHash", () => {
+		it("should return a fixed-length hex digest", () => {
+			const result = fastHash("some cache key material");
+
+			expect(result).toMatch(/^[0-9a-f]{16}$/);
+		});
+
+		it("should be deterministic", () => {
+			expect(fastHash("Mozilla/5.0 (X11; Linux x86_64)")).toBe(
+				fastHash("Mozilla/5.0 (X11; Linux x86_64)"),
+			);
+		});
+
+		it("should produce different digests for different input", () => {
+			expect(fastHash("input-a")).not.toBe(fastHash("input-b"));
+		});
+
+		it("should handle empty input", () => {
+			const result = fastHash("");
+
+			expect(result).toMatch(/^[0-9a-f]{16}$/);
+		});
+	});
+});
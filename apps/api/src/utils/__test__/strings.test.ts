@@ -1,6 +1,6 @@
 import { describe, expect, it } from "vitest";
 
-import { escapeRegExp, trimTemplateWhitespace } from "../strings";
+import { escapeRegExp, trimTemplateWhitespace, truncateAtWordBoundary } from "../strings";
 
 describe("strings", () => {
 	describe("trimTemplateWhitespace", () => {
@@ -96,4 +96,28 @@ describe("strings", () => {
 			expect(new RegExp(escaped).test("imagex1draft")).toBe(false);
 		});
 	});
+
+	describe("truncateAtWordBoundary", () => {
+		it("should return short text unchanged", () => {
+			expect(truncateAtWordBoundary("short text", 80)).toBe("short text");
+		});
+
+		it("should truncate at the last word boundary", () => {
+			const result = truncateAtWordBoundary("the quick brown fox jumps over the lazy dog", 20);
+
+			expect(result).toBe("the quick brown fox");
+		});
+
+		it("should hard cut when there is no usable word boundary", () => {
+			const result = truncateAtWordBoundary("supercalifragilisticexpialidocious", 10);
+
+			expect(result).toBe("supercalif");
+		});
+
+		it("should not split a surrogate pair", () => {
+			const result = truncateAtWordBoundary("ab\u{1f600}\u{1f600}", 3);
+
+			expect(result).toBe("ab");
+		});
+	});
 });
@@ -0,0 +1,58 @@
+/**
+ * Select the k best items under the comparator - the first k items that
+ * [...items].sort(compare).slice(0, k) would produce - without sorting the
+ * whole array. A bounded heap keeps this at O(n log k) instead of O(n log n),
+ * which matters when k is a small limit over a large candidate list.
+ *
+ * Ties are broken arbitrarily, so pass a fully deterministic comparator when
+ * the caller relies on tie order.
+ */
+export function selectTopK<T>(
+	items: readonly T[],
+	k: number,
+	compare: (a: T, b: T) => number,
+): T[] {
+	if (k <= 0) {
+		return [];
+	}
+	if (items.length <= k) {
+		return [...items].sort(compare);
+	}
+
+	// Heap ordered worst-first under the comparator: the root is the weakest
+	// of the k candidates kept so far and is evicted when a better item shows.
+	const heap = items.slice(0, k);
+
+	const siftDown = (start: number) => {
+		let parent = start;
+		while (true) {
+			const left = 2 * parent + 1;
+			const right = left + 1;
+			let worst = parent;
+			if (left < k && compare(heap[left], heap[worst]) > 0) {
+				worst = left;
+			}
+			if (right < k && compare(heap[right], heap[worst]) > 0) {
+				worst = right;
+			}
+			if (worst === parent) {
+				return;
+			}
+			[heap[parent], heap[worst]] = [heap[worst], heap[parent]];
+			parent = worst;
+		}
+	};
+
+	for (let i = (k >> 1) - 1; i >= 0; i--) {
+		siftDown(i);
+	}
+
+	for (let i = k; i < items.length; i++) {
+		if (compare(items[i], heap[0]) < 0) {
+			heap[0] = items[i];
+			siftDown(0);
+		}
+	}
+
+	return heap.sort(compare);
+}
@@ -3,9 +3,15 @@ export function chunkText(text: string, maxChars = 2000): string[] {
 	let start = 0;
 	while (start < text.length) {
 		let end = Math.min(start + maxChars, text.length);
-		const splitPos = Math.max(text.lastIndexOf("\n", end), text.lastIndexOf(" ", end));
-		if (splitPos > start) {
-			end = splitPos;
+		if (end < text.length) {
+			// Search for a split point within the current window only; an
+			// unbounded lastIndexOf scans back over already-chunked text and
+			// makes chunking quadratic when separators are sparse.
+			const window = text.slice(start, end);
+			const splitPos = Math.max(window.lastIndexOf("\n"), window.lastIndexOf(" "));
+			if (splitPos > 0) {
+				end = start + splitPos;
+			}
 		}
 		chunks.push(text.slice(start, end));
 		start = end;
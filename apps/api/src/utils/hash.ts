@@ -0,0 +1,25 @@
+const FNV_OFFSET_BASIS = 0x811c9dc5;
+const FNV_PRIME = 0x01000193;
+
+function fnv1a32(input: string, seed: number): number {
+	let hash = seed >>> 0;
+	for (let i = 0; i < input.length; i++) {
+		hash ^= input.charCodeAt(i);
+		hash = Math.imul(hash, FNV_PRIME);
+	}
+	return hash >>> 0;
+}
+
+/**
+ * Fast non-cryptographic hash for cache keys.
+ *
+ * Runs FNV-1a over two independently seeded 32-bit lanes and returns a fixed
+ * 16-hex-character digest. It is synchronous and allocation-free, unlike the
+ * WebCrypto helpers in crypto.ts; use sha256Hex where collision resistance
+ * actually matters.
+ */
+export function fastHash(input: string): string {
+	const high = fnv1a32(input, FNV_OFFSET_BASIS);
+	const low = fnv1a32(input, ~FNV_OFFSET_BASIS);
+	return high.toString(16).padStart(8, "0") + low.toString(16).padStart(8, "0");
+}
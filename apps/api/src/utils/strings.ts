@@ -15,3 +15,28 @@ export function compactNonEmptyStrings(values: Array<string | null | undefined>)
 export function escapeRegExp(value: string): string {
 	return value.replace(/[.*+?^${}()|[\]\\]/g, "\\$&");
 }
+
+/**
+ * Truncate text to at most maxLength characters without cutting a word (or a
+ * surrogate pair) in half. Falls back to a hard cut when the text has no
+ * usable word boundary in its second half.
+ */
+export function truncateAtWordBoundary(text: string, maxLength: number): string {
+	if (text.length <= maxLength) {
+		return text;
+	}
+
+	let truncated = text.slice(0, maxLength);
+
+	const lastCode = truncated.charCodeAt(truncated.length - 1);
+	if (lastCode >= 0xd800 && lastCode <= 0xdbff) {
+		truncated = truncated.slice(0, -1);
+	}
+
+	const lastSpace = truncated.lastIndexOf(" ");
+	if (lastSpace > maxLength / 2) {
+		truncated = truncated.slice(0, lastSpace);
+	}
+
+	return truncated.trimEnd();
+}
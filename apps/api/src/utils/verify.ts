@@ -1,14 +1,16 @@
+const NON_WORD_CHARS = /[^\w\s]/g;
+const WHITESPACE = /\s+/;
+
+// Collapsing whitespace via split/join is cheaper than a second global
+// replace pass and trims leading/trailing whitespace in the same step.
+function normalizeText(text: string): string {
+	return text.toLowerCase().replace(NON_WORD_CHARS, "").split(WHITESPACE).filter(Boolean).join(" ");
+}
+
 export function verifyQuotes(
 	originalArticle: string,
 	quotes: string[],
 ): { verified: boolean; missingQuotes: string[] } {
-	const normalizeText = (text: string) =>
-		text
-			.toLowerCase()
-			.replace(/[^\w\s]/g, "")
-			.replace(/\s+/g, " ")
-			.trim();
-
 	const normalizedArticle = normalizeText(originalArticle);
 
 	const missingQuotes = quotes.filter((quote) => {